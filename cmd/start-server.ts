@@ -151,6 +151,9 @@ try {
   server = Bun.serve({
     port: PORT,
     fetch: app.fetch,
+    // Job progress streams stay open for the whole scrape and only send a heartbeat
+    // every 30s, so lift Bun's 10s default idle timeout to its maximum.
+    idleTimeout: 255,
   });
 
   process.stdout.write(`[SUCCESS] Server started on port ${server.port}\n`);
@@ -6,8 +6,9 @@
 import { Pool } from 'pg';
 import { PrismaPg } from '@prisma/adapter-pg';
 import { PrismaClient } from '../../generated/prisma/client';
-import { ErrorLog, Job, Task, Tweet } from '../../generated/prisma/client';
+import { ErrorLog, Job, Prisma, Task, Tweet } from '../../generated/prisma/client';
 import { createEnhancedLogger } from '../../utils/logger';
+import type { FlattenedComment, RedditPost as ScrapedRedditPost } from '../platforms/reddit/types';
 
 const logger = createEnhancedLogger('DB');
 
@@ -270,3 +271,124 @@ export class TweetRepository {
     return new Set(found.map((t) => t.id));
   }
 }
+
+// ==========================================
+// Part 5: Reddit Repository
+// ==========================================
+
+// Rows per batched comment UPDATE (8 bind parameters each, well under Postgres' 65535 limit)
+const COMMENT_UPDATE_BATCH_SIZE = 1000;
+
+export class RedditRepository {
+  /**
+   * Save a post and its comments in one transaction: a single commit per thread
+   * instead of one per statement, and no half-saved threads on failure.
+   */
+  static async savePost(post: ScrapedRedditPost, comments: FlattenedComment[]): Promise<void> {
+    await prisma.$transaction((tx) => RedditRepository.writePost(tx, post, comments), {
+      timeout: 30000,
+    });
+  }
+
+  private static async writePost(
+    tx: Prisma.TransactionClient,
+    post: ScrapedRedditPost,
+    comments: FlattenedComment[],
+  ): Promise<void> {
+    await tx.redditPost.upsert({
+      where: { id: post.id },
+      update: {
+        title: post.title,
+        selftext: post.selftext,
+        author: post.author,
+        subreddit: post.subreddit,
+        score: post.score,
+        upvoteRatio: post.upvote_ratio,
+        numComments: post.num_comments,
+        createdUtc: post.created_utc,
+        url: post.url,
+        permalink: post.permalink,
+        isSelf: post.is_self,
+      },
+      create: {
+        id: post.id,
+        name: post.name || `t3_${post.id}`,
+        title: post.title,
+        selftext: post.selftext,
+        author: post.author,
+        subreddit: post.subreddit,
+        subredditNamePrefixed: post.subreddit_name_prefixed || `r/${post.subreddit}`,
+        score: post.score,
+        upvoteRatio: post.upvote_ratio,
+        numComments: post.num_comments,
+        createdUtc: post.created_utc,
+        url: post.url,
+        permalink: post.permalink,
+        isSelf: post.is_self,
+      },
+    });
+
+    if (comments.length === 0) return;
+
+    // One lookup for the whole thread instead of an upsert round trip per comment:
+    // new comments go in with a single createMany, only known ones are updated.
+    const existingIds = await RedditRepository.getExistingCommentIds(
+      comments.map((c) => c.id),
+      tx,
+    );
+    const newComments = comments.filter((c) => !existingIds.has(c.id));
+
+    if (newComments.length > 0) {
+      await tx.redditComment.createMany({
+        data: newComments.map((comment) => ({
+          id: comment.id,
+          name: `t1_${comment.id}`,
+          author: comment.author,
+          body: comment.body,
+          score: comment.score,
+          createdUtc: comment.created_utc,
+          depth: comment.depth,
+          parentId: comment.parent_id,
+          permalink: comment.permalink,
+          postId: post.id,
+        })),
+        skipDuplicates: true,
+      });
+    }
+
+    // Known comments are refreshed with one UPDATE ... FROM (VALUES ...) per batch instead of
+    // a round trip each, so re-scraping a large thread stays well inside the transaction timeout
+    const existingComments = comments.filter((c) => existingIds.has(c.id));
+    for (let i = 0; i < existingComments.length; i += COMMENT_UPDATE_BATCH_SIZE) {
+      const rows = existingComments.slice(i, i + COMMENT_UPDATE_BATCH_SIZE).map(
+        (c) => Prisma.sql`(${c.id}, ${c.author}, ${c.body}, ${c.score}::int,
+          ${c.created_utc}::float8, ${c.depth}::int, ${c.parent_id}::text, ${c.permalink})`,
+      );
+      await tx.$executeRaw`
+        UPDATE "RedditComment" AS c SET
+          "author" = v."author",
+          "body" = v."body",
+          "score" = v."score",
+          "createdUtc" = v."createdUtc",
+          "depth" = v."depth",
+          "parentId" = v."parentId",
+          "permalink" = v."permalink",
+          "postId" = ${post.id}
+        FROM (VALUES ${Prisma.join(rows)})
+          AS v("id", "author", "body", "score", "createdUtc", "depth", "parentId", "permalink")
+        WHERE c."id" = v."id"
+      `;
+    }
+  }
+
+  static async getExistingCommentIds(
+    ids: string[],
+    client: Prisma.TransactionClient = prisma,
+  ): Promise<Set<string>> {
+    const found = await client.redditComment.findMany({
+      where: { id: { in: ids } },
+      select: { id: true },
+    });
+    return new Set(found.map((c) => c.id));
+  }
+}
@@ -8,6 +8,8 @@ import * as fs from 'node:fs';
 import * as path from 'node:path';
 import { getOutputPathManager } from '../../utils';
 import { createEnhancedLogger } from '../../utils/logger';
+import { RedditRepository } from '../db/repositories';
+import { ProxyManager } from '../proxy-manager';
 import { ScraperEventBus } from '../scraper-engine.types';
 import { exportRedditToMarkdown } from './reddit/markdown-export';
 import { RedditScraper } from './reddit/scraper';
@@ -16,6 +18,48 @@ import { PlatformAdapter } from './types';
 
 const logger = createEnhancedLogger('RedditAdapter');
 
+// Map strategy to sortType
+// strategy can be: 'auto', 'super_full', 'super_recent', 'new'
+// sortType can be: 'hot', 'new', 'top'
+// (a Map, so request-supplied names like 'constructor' can't resolve to Object.prototype)
+const STRATEGY_SORT_TYPES = new Map<string, 'hot' | 'new' | 'top'>([
+  ['auto', 'hot'],
+  ['new', 'new'],
+  ['super_recent', 'new'],
+  ['super_full', 'top'],
+]);
+
+// One ProxyManager shared by the jobs in a worker: proxy files are parsed once and proxy
+// health stats carry over between jobs instead of being rebuilt for every scrape. It is
+// reloaded every PROXY_MANAGER_REFRESH_MS so edited proxy files get picked up, and an
+// empty load is never kept, so adding files to ./proxy takes effect on the next job.
+const PROXY_MANAGER_REFRESH_MS = 10 * 60 * 1000;
+let cachedProxyManager: { manager: Promise<ProxyManager>; loadedAt: number } | null = null;
+
+async function getProxyManager(): Promise<ProxyManager> {
+  const now = Date.now();
+  if (!cachedProxyManager || now - cachedProxyManager.loadedAt >= PROXY_MANAGER_REFRESH_MS) {
+    cachedProxyManager = {
+      manager: (async () => {
+        const manager = new ProxyManager();
+        await manager.init();
+        return manager;
+      })(),
+      loadedAt: now,
+    };
+  }
+
+  const cached = cachedProxyManager;
+  try {
+    const manager = await cached.manager;
+    if (!manager.hasProxies() && cachedProxyManager === cached) cachedProxyManager = null;
+    return manager;
+  } catch (error) {
+    if (cachedProxyManager === cached) cachedProxyManager = null;
+    throw error;
+  }
+}
+
 export const redditAdapter: PlatformAdapter = {
   name: 'reddit',
 
@@ -30,9 +74,7 @@ export const redditAdapter: PlatformAdapter = {
     let proxyManager: any = null;
     if (jobConfig.enableProxy) {
       await ctx.log('🔧 Proxy enabled - Initializing proxy manager...', 'info');
-      const { ProxyManager } = await import('../proxy-manager');
-      proxyManager = new ProxyManager();
-      await proxyManager.init();
+      proxyManager = await getProxyManager();
 
       const stats = proxyManager.getStats();
       await ctx.log(
@@ -132,8 +174,8 @@ export const redditAdapter: PlatformAdapter = {
     await ctx.log(`Reddit scraper initialized`, 'info');
 
     try {
-      type ScrapedItem = RedditPost & { comments: FlattenedComment[] };
-      let posts: ScrapedItem[] = [];
+      // Keep the scraper's { post, comments } shape end to end; no per-post copies
+      let posts: Array<{ post: RedditPost; comments: FlattenedComment[] }> = [];
       let markdownPath: string | undefined;
 
       if (isPostUrl && jobConfig.postUrl) {
@@ -149,7 +191,7 @@ export const redditAdapter: PlatformAdapter = {
         );
 
         if (scrapeResult.status === 'success' && scrapeResult.post && scrapeResult.comments) {
-          posts = [{ ...scrapeResult.post, comments: scrapeResult.comments }];
+          posts = [{ post: scrapeResult.post, comments: scrapeResult.comments }];
           await ctx.log(`Scraped post with ${scrapeResult.comments.length} comments`, 'info');
         } else {
           throw new Error(scrapeResult.message || 'Failed to scrape post');
@@ -159,22 +201,12 @@ export const redditAdapter: PlatformAdapter = {
         const subreddit = jobConfig.subreddit;
         const limit = jobConfig.limit || 50;
 
-        // Map strategy to sortType
-        // strategy can be: 'auto', 'super_full', 'super_recent', 'new'
-        // sortType can be: 'hot', 'new', 'top'
+        // 'auto' or unknown strategies -> 'hot'
         const strategy = (jobConfig as any).strategy || 'auto';
-        let sortType: 'hot' | 'new' | 'top' = 'hot';
-        if (strategy === 'new' || strategy === 'super_recent') {
-          sortType = 'new';
-        } else if (strategy === 'super_full') {
-          sortType = 'top';
-        } else {
-          // 'auto' or default -> 'hot'
-          sortType = 'hot';
-        }
+        const sortType = STRATEGY_SORT_TYPES.get(strategy) ?? 'hot';
 
         await ctx.log(
-          `Starting subreddit scrape: r/${subreddit} (limit: ${limit}, sort: ${sortType}, estimated: ~${((limit * 3) / 60).toFixed(1)} min)`,
+          `Starting subreddit scrape: r/${subreddit} (limit: ${limit}, sort: ${sortType}, estimated: ~${(limit / 60).toFixed(1)} min)`,
           'info',
         );
 
@@ -193,10 +225,7 @@ export const redditAdapter: PlatformAdapter = {
         );
 
         if (scrapeResult.status === 'success' && scrapeResult.posts) {
-          posts = scrapeResult.posts.map((item) => ({
-            ...item.post,
-            comments: item.comments,
-          }));
+          posts = scrapeResult.posts;
           await ctx.log(`Successfully scraped ${posts.length} posts`, 'info');
         } else {
           throw new Error(scrapeResult.message || 'Failed to scrape subreddit');
@@ -209,78 +238,15 @@ export const redditAdapter: PlatformAdapter = {
       if (posts.length > 0) {
         await ctx.log(`Saving ${posts.length} posts to database...`);
 
-        const { prisma } = await import('../db/prisma');
-
         for (const item of posts) {
           try {
             if (await ctx.getShouldStop()) {
               throw new Error('Job cancelled');
             }
 
-            // Save post
-            await prisma.redditPost.upsert({
-              where: { id: item.id },
-              update: {
-                title: item.title,
-                selftext: item.selftext,
-                author: item.author,
-                subreddit: item.subreddit,
-                score: item.score,
-                upvoteRatio: item.upvote_ratio,
-                numComments: item.num_comments,
-                createdUtc: item.created_utc,
-                url: item.url,
-                permalink: item.permalink,
-                isSelf: item.is_self,
-              },
-              create: {
-                id: item.id,
-                name: item.name || `t3_${item.id}`,
-                title: item.title,
-                selftext: item.selftext,
-                author: item.author,
-                subreddit: item.subreddit,
-                subredditNamePrefixed: item.subreddit_name_prefixed || `r/${item.subreddit}`,
-                score: item.score,
-                upvoteRatio: item.upvote_ratio,
-                numComments: item.num_comments,
-                createdUtc: item.created_utc,
-                url: item.url,
-                permalink: item.permalink,
-                isSelf: item.is_self,
-              },
-            });
-
-            // Save comments
-            for (const comment of item.comments) {
-              await prisma.redditComment.upsert({
-                where: { id: comment.id },
-                update: {
-                  author: comment.author,
-                  body: comment.body,
-                  score: comment.score,
-                  createdUtc: comment.created_utc,
-                  depth: comment.depth,
-                  parentId: comment.parent_id,
-                  permalink: comment.permalink,
-                  postId: item.id,
-                },
-                create: {
-                  id: comment.id,
-                  name: `t1_${comment.id}`,
-                  author: comment.author,
-                  body: comment.body,
-                  score: comment.score,
-                  createdUtc: comment.created_utc,
-                  depth: comment.depth,
-                  parentId: comment.parent_id,
-                  permalink: comment.permalink,
-                  postId: item.id,
-                },
-              });
-            }
+            await RedditRepository.savePost(item.post, item.comments);
           } catch (e: any) {
-            await ctx.log(`Failed to save post ${item.id}: ${e.message}`, 'error');
+            await ctx.log(`Failed to save post ${item.post.id}: ${e.message}`, 'error');
           }
         }
 
@@ -303,18 +269,12 @@ export const redditAdapter: PlatformAdapter = {
         const runDir = path.join(baseDir, 'reddit', subredditName, `run-${timestamp}`);
         fs.mkdirSync(runDir, { recursive: true });
 
-        // Convert to markdown format
-        const postsForMarkdown = posts.map((p) => ({
-          post: p as RedditPost,
-          comments: p.comments,
-        }));
-
         // For single post, use post title as filename (exportRedditToMarkdown handles this)
         // For multiple posts, use index.md
         const filename = posts.length === 1
           ? undefined // Let exportRedditToMarkdown use post title
           : `reddit_${subredditName}_${timestamp}.md`; // Multiple posts use timestamp
-        markdownPath = exportRedditToMarkdown(postsForMarkdown, runDir, filename);
+        markdownPath = exportRedditToMarkdown(posts, runDir, filename);
 
         await ctx.log(`Markdown export saved: ${markdownPath}`, 'info');
         await ctx.log(
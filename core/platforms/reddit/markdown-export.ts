@@ -5,8 +5,15 @@
 
 import * as fs from 'node:fs';
 import * as path from 'node:path';
+import * as zlib from 'node:zlib';
 import { FlattenedComment, RedditPost } from './types';
 
+// Blank line, rule, blank line: closes every header/content section
+const SECTION_END: readonly string[] = ['', '---', ''];
+
+// Comment indents by depth; deeper threads fall back to repeat()
+const INDENTS: readonly string[] = Array.from({ length: 32 }, (_, depth) => '  '.repeat(depth));
+
 /**
  * Format a Reddit post with comments as Markdown
  */
@@ -22,25 +29,19 @@ export function formatPostAsMarkdown(post: RedditPost, comments: FlattenedCommen
   );
   lines.push(`**Posted**: ${new Date(post.created_utc * 1000).toISOString()}`);
   lines.push(`**URL**: ${post.permalink}`);
-  lines.push('');
-  lines.push('---');
-  lines.push('');
+  lines.push(...SECTION_END);
 
   // Post content
   if (post.selftext) {
     lines.push('## Post Content');
     lines.push('');
     lines.push(post.selftext);
-    lines.push('');
-    lines.push('---');
-    lines.push('');
+    lines.push(...SECTION_END);
   } else if (post.url && !post.is_self) {
     lines.push('## Link');
     lines.push('');
     lines.push(`[${post.url}](${post.url})`);
-    lines.push('');
-    lines.push('---');
-    lines.push('');
+    lines.push(...SECTION_END);
   }
 
   // Comments
@@ -49,7 +50,7 @@ export function formatPostAsMarkdown(post: RedditPost, comments: FlattenedCommen
     lines.push('');
 
     for (const comment of comments) {
-      const indent = '  '.repeat(comment.depth);
+      const indent = INDENTS[comment.depth] ?? '  '.repeat(comment.depth);
       const submitterBadge = comment.is_submitter ? ' `[OP]`' : '';
       const gildedBadge = comment.gilded > 0 ? ` 🏆×${comment.gilded}` : '';
 
@@ -59,10 +60,7 @@ export function formatPostAsMarkdown(post: RedditPost, comments: FlattenedCommen
       lines.push('');
 
       // Format comment body with proper indentation
-      const bodyLines = comment.body.split('\n');
-      for (const bodyLine of bodyLines) {
-        lines.push(`${indent}${bodyLine}`);
-      }
+      lines.push(indent ? indent + comment.body.replace(/\n/g, `\n${indent}`) : comment.body);
 
       lines.push('');
     }
@@ -91,7 +89,7 @@ export function exportRedditToMarkdown(
     markdownPath = path.join(outputDir, basename);
 
     const content = formatPostAsMarkdown(post.post, post.comments);
-    fs.writeFileSync(markdownPath, content, 'utf-8');
+    writeMarkdownFile(markdownPath, content);
   } else {
     // Multiple posts - create index
     markdownPath = path.join(outputDir, filename || 'index.md');
@@ -101,9 +99,7 @@ export function exportRedditToMarkdown(
     lines.push('');
     lines.push(`**Total Posts**: ${posts.length}`);
     lines.push(`**Exported**: ${new Date().toISOString()}`);
-    lines.push('');
-    lines.push('---');
-    lines.push('');
+    lines.push(...SECTION_END);
 
     for (let i = 0; i < posts.length; i++) {
       const { post } = posts[i];
@@ -125,24 +121,36 @@ export function exportRedditToMarkdown(
       lines.push('');
     }
 
-    fs.writeFileSync(markdownPath, lines.join('\n'), 'utf-8');
+    writeMarkdownFile(markdownPath, lines.join('\n'));
 
-    // Also save individual posts
+    // Also save individual posts (compressed too when the index is)
+    const postExtension = markdownPath.endsWith('.gz') ? '.md.gz' : '.md';
     for (let i = 0; i < posts.length; i++) {
       const { post, comments } = posts[i];
       const sanitizedTitle = sanitizeFilename(post.title);
       const postPath = path.join(
         outputDir,
-        `${String(i + 1).padStart(3, '0')}-${sanitizedTitle}.md`,
+        `${String(i + 1).padStart(3, '0')}-${sanitizedTitle}${postExtension}`,
       );
       const content = formatPostAsMarkdown(post, comments);
-      fs.writeFileSync(postPath, content, 'utf-8');
+      writeMarkdownFile(postPath, content);
     }
   }
 
   return markdownPath;
 }
 
+/**
+ * Write Markdown, gzip-compressing (fast level) when the target path ends in .gz
+ */
+function writeMarkdownFile(filePath: string, content: string): void {
+  if (filePath.endsWith('.gz')) {
+    fs.writeFileSync(filePath, zlib.gzipSync(content, { level: 1 }));
+  } else {
+    fs.writeFileSync(filePath, content, 'utf-8');
+  }
+}
+
 /**
  * Sanitize filename (remove special characters)
  */
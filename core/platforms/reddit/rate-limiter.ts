@@ -0,0 +1,74 @@
+/**
+ * Reddit Rate Limiter
+ *
+ * Token bucket sized to Reddit's request budget. The refill rate follows the
+ * X-Ratelimit-Remaining / X-Ratelimit-Reset response headers, so requests go
+ * out as fast as the current window allows instead of after a fixed sleep.
+ */
+
+const DEFAULT_REQUESTS_PER_MINUTE = 60;
+const DEFAULT_BURST = 3;
+
+export class RedditRateLimiter {
+  private tokens: number;
+  private msPerToken: number;
+  private lastRefill: number;
+
+  constructor(
+    private readonly burst: number = DEFAULT_BURST,
+    requestsPerMinute: number = DEFAULT_REQUESTS_PER_MINUTE,
+    private readonly now: () => number = Date.now,
+  ) {
+    this.tokens = burst;
+    this.msPerToken = 60000 / requestsPerMinute;
+    this.lastRefill = this.now();
+  }
+
+  /**
+   * Take a token if one is available.
+   * Returns 0 on success, otherwise the milliseconds until the next token.
+   */
+  tryAcquire(): number {
+    this.refill();
+    if (this.tokens >= 1) {
+      this.tokens -= 1;
+      return 0;
+    }
+    return Math.ceil((1 - this.tokens) * this.msPerToken);
+  }
+
+  /**
+   * Wait until a token is available and take it.
+   * `wait` lets callers sleep through their own cancellation-aware delay.
+   */
+  async acquire(
+    wait: (ms: number) => Promise<void> = (ms) => new Promise((resolve) => setTimeout(resolve, ms)),
+  ): Promise<void> {
+    for (let waitMs = this.tryAcquire(); waitMs > 0; waitMs = this.tryAcquire()) {
+      await wait(waitMs);
+    }
+  }
+
+  /**
+   * Adapt to Reddit's reported budget: spread the remaining requests evenly over
+   * the seconds left in the window. With nothing left, the next token arrives
+   * when the window resets.
+   */
+  observeHeaders(headers: Record<string, unknown>): void {
+    const remaining = Number(headers['x-ratelimit-remaining']);
+    const resetSeconds = Number(headers['x-ratelimit-reset']);
+    if (!Number.isFinite(remaining) || !Number.isFinite(resetSeconds) || resetSeconds <= 0) {
+      return;
+    }
+
+    this.refill();
+    this.msPerToken = (resetSeconds * 1000) / Math.max(remaining, 1);
+    this.tokens = Math.min(this.tokens, Math.max(remaining, 0));
+  }
+
+  private refill(): void {
+    const now = this.now();
+    this.tokens = Math.min(this.burst, this.tokens + (now - this.lastRefill) / this.msPerToken);
+    this.lastRefill = now;
+  }
+}
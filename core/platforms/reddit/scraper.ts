@@ -5,12 +5,15 @@
  * Follows the same architectural patterns as Twitter adapter
  */
 
+import * as http from 'node:http';
+import * as https from 'node:https';
 import axios, { AxiosInstance, AxiosRequestConfig } from 'axios';
 import { HttpProxyAgent } from 'http-proxy-agent';
 import { HttpsProxyAgent } from 'https-proxy-agent';
 import { createEnhancedLogger } from '../../../utils';
 import { ProxyConfig } from '../../browser-manager';
 import { ScraperEventBus } from '../../scraper-engine.types';
+import { RedditRateLimiter } from './rate-limiter';
 import {
   FlattenedComment,
   RedditComment,
@@ -23,6 +26,70 @@ import {
 
 const logger = createEnhancedLogger('RedditScraper');
 
+const REDDIT_BASE_URL = 'https://www.reddit.com';
+
+/**
+ * Request headers shared by every client (built once at module load)
+ */
+const REDDIT_HEADERS: Readonly<Record<string, string>> = Object.freeze({
+  'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+  Accept: 'application/json',
+  'Accept-Language': 'en-US,en;q=0.9',
+});
+
+// Post ID from a permalink (/r/sub/comments/{id}/title/), else the last path segment
+const POST_ID_PATTERN = /\/comments\/([^/]+)/;
+const LAST_PATH_SEGMENT_PATTERN = /([^/]+)\/*$/;
+
+/**
+ * delay() logging: waits shorter than DELAY_LOG_MIN_MS are silent, longer ones
+ * report progress at most once per DELAY_PROGRESS_LOG_INTERVAL_MS.
+ */
+const DELAY_LOG_MIN_MS = 5000;
+const DELAY_PROGRESS_LOG_INTERVAL_MS = 5000;
+
+/**
+ * Post detail fetches kept in flight at once. Pacing comes from the
+ * scraper's RedditRateLimiter, shared by all workers.
+ */
+const POST_FETCH_CONCURRENCY = 3;
+
+/**
+ * Keep-alive socket pool shared by direct and proxied agents.
+ * Scraping is many small requests to the same host, so reusing sockets
+ * saves a TCP + TLS handshake on every request after the first.
+ */
+const KEEP_ALIVE_OPTIONS: http.AgentOptions = {
+  keepAlive: true,
+  maxSockets: 64,
+  maxFreeSockets: 32,
+  timeout: 75000,
+};
+
+/**
+ * Agent pairs keyed by proxy URL ('direct' for no proxy). Shared across scraper
+ * instances so warm sockets survive between jobs and proxy switches.
+ */
+const agentPool = new Map<string, { httpAgent: http.Agent; httpsAgent: http.Agent }>();
+
+function getAgents(proxyUrl?: string): { httpAgent: http.Agent; httpsAgent: http.Agent } {
+  const key = proxyUrl || 'direct';
+  let agents = agentPool.get(key);
+  if (!agents) {
+    agents = proxyUrl
+      ? {
+          httpAgent: new HttpProxyAgent(proxyUrl, KEEP_ALIVE_OPTIONS),
+          httpsAgent: new HttpsProxyAgent(proxyUrl, KEEP_ALIVE_OPTIONS),
+        }
+      : {
+          httpAgent: new http.Agent(KEEP_ALIVE_OPTIONS),
+          httpsAgent: new https.Agent(KEEP_ALIVE_OPTIONS),
+        };
+    agentPool.set(key, agents);
+  }
+  return agents;
+}
+
 export class RedditScraper {
   private client: AxiosInstance;
   private eventBus?: ScraperEventBus;
@@ -30,6 +97,7 @@ export class RedditScraper {
   private abortController: AbortController;
   private proxyManager?: any; // ProxyManager instance for auto-rotation
   private currentProxy?: ProxyConfig & { id?: string }; // Current proxy config with ID
+  private rateLimiter = new RedditRateLimiter();
 
   constructor(
     proxyConfig?: ProxyConfig & { id?: string },
@@ -56,11 +124,7 @@ export class RedditScraper {
     }
 
     const axiosConfig: AxiosRequestConfig = {
-      headers: {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-        Accept: 'application/json',
-        'Accept-Language': 'en-US,en;q=0.9',
-      },
+      headers: { ...REDDIT_HEADERS },
       timeout: 20000, // 20s timeout - will retry on timeout
       signal: this.abortController.signal,
       validateStatus: (status) => status < 500, // Don't throw on 4xx
@@ -74,8 +138,7 @@ export class RedditScraper {
           ? `http://${proxyConfig.username}:${proxyConfig.password}@${proxyConfig.host}:${proxyConfig.port}`
           : `http://${proxyConfig.host}:${proxyConfig.port}`;
 
-      const httpsAgent = new HttpsProxyAgent(proxyUrl);
-      const httpAgent = new HttpProxyAgent(proxyUrl);
+      const { httpsAgent, httpAgent } = getAgents(proxyUrl);
 
       axiosConfig.httpsAgent = httpsAgent;
       axiosConfig.httpAgent = httpAgent;
@@ -96,12 +159,28 @@ export class RedditScraper {
       });
     } else {
       axiosConfig.proxy = false;
+      const { httpsAgent, httpAgent } = getAgents();
+      axiosConfig.httpAgent = httpAgent;
+      axiosConfig.httpsAgent = httpsAgent;
       this.log('🌐 Axios client configured for direct connection (no proxy)', 'info', {
         proxyEnabled: false,
+        keepAlive: true,
       });
     }
 
-    this.client = axios.create(axiosConfig);
+    this.client = this.createClient(axiosConfig);
+  }
+
+  /**
+   * Create the axios client; every response feeds Reddit's rate limit headers to the limiter
+   */
+  private createClient(axiosConfig: AxiosRequestConfig): AxiosInstance {
+    const client = axios.create(axiosConfig);
+    client.interceptors.response.use((response) => {
+      this.rateLimiter.observeHeaders(response.headers);
+      return response;
+    });
+    return client;
   }
 
   /**
@@ -166,15 +245,10 @@ export class RedditScraper {
         ? `http://${nextProxy.username}:${nextProxy.password}@${nextProxy.host}:${nextProxy.port}`
         : `http://${nextProxy.host}:${nextProxy.port}`;
 
-    const httpsAgent = new HttpsProxyAgent(proxyUrl);
-    const httpAgent = new HttpProxyAgent(proxyUrl);
+    const { httpsAgent, httpAgent } = getAgents(proxyUrl);
 
     const axiosConfig: AxiosRequestConfig = {
-      headers: {
-        'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-        Accept: 'application/json',
-        'Accept-Language': 'en-US,en;q=0.9',
-      },
+      headers: { ...REDDIT_HEADERS },
       timeout: 20000,
       signal: this.abortController.signal, // Use the (possibly new) abort controller
       validateStatus: (status) => status < 500,
@@ -183,7 +257,7 @@ export class RedditScraper {
       proxy: false, // Don't use axios proxy config when using agents
     };
 
-    this.client = axios.create(axiosConfig);
+    this.client = this.createClient(axiosConfig);
 
     this.log(`✅ Switched to new proxy: ${nextProxy.host}:${nextProxy.port}`, 'info', {
       newProxyHost: nextProxy.host,
@@ -195,6 +269,26 @@ export class RedditScraper {
     return true;
   }
 
+  /**
+   * Rotate away from a proxy that failed a request.
+   * Post fetches run concurrently on the shared client, so a worker may report a proxy that
+   * another worker already replaced; in that case nothing is marked and the caller simply
+   * retries on the current proxy.
+   */
+  private rotateFailedProxy(
+    failedProxyId: string | undefined,
+    reason: string,
+    failureDetail?: string,
+  ): boolean {
+    if (this.currentProxy?.id !== failedProxyId) {
+      return true;
+    }
+    if (failureDetail && failedProxyId) {
+      this.proxyManager?.markProxyFailed(failedProxyId, failureDetail);
+    }
+    return this.switchToNextProxy(reason);
+  }
+
   private log(message: string, level: 'info' | 'warn' | 'error' = 'info', details?: any) {
     const timestamp = new Date().toISOString();
     const logMessage = details ? `${message} | Details: ${JSON.stringify(details)}` : message;
@@ -239,19 +333,24 @@ export class RedditScraper {
     const step = 500;
     let elapsed = 0;
     const delayStartTime = Date.now();
+    // Short pacing waits happen per request; only long waits are worth a log line
+    const verbose = ms >= DELAY_LOG_MIN_MS;
+    let lastProgressLog = delayStartTime;
 
-    this.log(`Starting delay of ${ms}ms`, 'info', { delayMs: ms });
+    if (verbose) {
+      this.log(`Starting delay of ${ms}ms`, 'info', { delayMs: ms });
+    }
 
     while (elapsed < ms) {
       await this.checkCancel();
       const wait = Math.min(step, ms - elapsed);
       const waitStart = Date.now();
       await new Promise((resolve) => setTimeout(resolve, wait));
-      const actualWait = Date.now() - waitStart;
-      elapsed += actualWait;
+      const now = Date.now();
+      elapsed += now - waitStart;
 
-      // Log progress every 2 seconds
-      if (elapsed % 2000 < step) {
+      if (verbose && elapsed < ms && now - lastProgressLog >= DELAY_PROGRESS_LOG_INTERVAL_MS) {
+        lastProgressLog = now;
         this.log(
           `Delay progress: ${elapsed}/${ms}ms (${((elapsed / ms) * 100).toFixed(1)}%)`,
           'info',
@@ -264,12 +363,14 @@ export class RedditScraper {
       }
     }
 
-    const actualDelay = Date.now() - delayStartTime;
-    this.log(`Delay completed`, 'info', {
-      requested: ms,
-      actual: actualDelay,
-      difference: actualDelay - ms,
-    });
+    if (verbose) {
+      const actualDelay = Date.now() - delayStartTime;
+      this.log(`Delay completed`, 'info', {
+        requested: ms,
+        actual: actualDelay,
+        difference: actualDelay - ms,
+      });
+    }
   }
 
   /**
@@ -285,15 +386,17 @@ export class RedditScraper {
     this.log(`Fetching post list from r/${subreddit} (limit: ${limit}, sort: ${sort})`);
 
     const posts: Array<{ url: string; id: string }> = [];
+    // Rankings shift between page requests, so a post can reappear on the next page
+    const seenIds = new Set<string>();
     let after: string | null = null;
     let page = 1;
+    const url = `${REDDIT_BASE_URL}/r/${subreddit}/${sort}.json`;
 
     while (posts.length < limit) {
       await this.checkCancel();
 
       this.log(`Fetching page ${page}... (found ${posts.length}/${limit})`);
 
-      const url = `https://www.reddit.com/r/${subreddit}/${sort}.json`;
       const requestParams: Record<string, any> = {
         limit: Math.min(100, limit - posts.length),
         after,
@@ -311,6 +414,9 @@ export class RedditScraper {
       } | null = null;
 
       while (retryCount <= maxRetries && !response) {
+        // Pages share the token bucket with post fetches instead of a fixed 2s sleep;
+        // retries take a token too, so they stay inside Reddit's request budget
+        await this.rateLimiter.acquire((ms) => this.delay(ms));
         await this.checkCancel();
 
         if (retryCount > 0) {
@@ -689,11 +795,13 @@ export class RedditScraper {
 
       // Successfully got response, process it
       try {
+        // Decoded JSON size; serialize the page once and reuse it for both log fields
+        const responseSize = JSON.stringify(response.data).length;
         this.log(`✅ HTTP request completed successfully`, 'info', {
           status: response.status || 'N/A',
           statusText: response.statusText || 'N/A',
-          responseSize: JSON.stringify(response.data).length,
-          responseSizeKB: `${(JSON.stringify(response.data).length / 1024).toFixed(2)} KB`,
+          responseSize,
+          responseSizeKB: `${(responseSize / 1024).toFixed(2)} KB`,
           headers: response.headers ? Object.keys(response.headers) : [],
         });
 
@@ -762,22 +870,23 @@ export class RedditScraper {
 
         let t3Count = 0;
         let otherKindCount = 0;
+        const skippedKinds: Record<string, number> = {};
         for (const child of children) {
           if (child.kind === 't3') {
             t3Count++;
             const post = child.data as RedditPost;
+            if (seenIds.has(post.id)) continue;
+            seenIds.add(post.id);
             // Use permalink instead of url - permalink is always the Reddit post link
             // url can be external links, images, videos, etc.
             const postUrl = post.permalink.startsWith('http')
               ? post.permalink
-              : `https://www.reddit.com${post.permalink}`;
+              : REDDIT_BASE_URL + post.permalink;
             posts.push({ url: postUrl, id: post.id });
           } else {
+            // Tallied into the page summary below instead of one log line per child
             otherKindCount++;
-            this.log(`Skipping non-post child`, 'info', {
-              kind: child.kind,
-              totalSkipped: otherKindCount,
-            });
+            skippedKinds[child.kind] = (skippedKinds[child.kind] || 0) + 1;
           }
         }
 
@@ -785,6 +894,7 @@ export class RedditScraper {
           totalChildren: children.length,
           postsFound: t3Count,
           otherKinds: otherKindCount,
+          ...(otherKindCount > 0 && { skippedKinds }),
           totalPostsSoFar: posts.length,
         });
 
@@ -800,9 +910,6 @@ export class RedditScraper {
         if (!after) break;
 
         page++;
-        if (posts.length < limit) {
-          await this.delay(2000); // 2s between pages
-        }
       } catch (error: any) {
         await this.checkCancel();
 
@@ -928,6 +1035,33 @@ export class RedditScraper {
     return posts.slice(0, limit);
   }
 
+  /**
+   * Flatten a comment listing depth-first into `out`, replies right after their parent
+   */
+  private flattenComments(listing: RedditListing, out: FlattenedComment[]): void {
+    for (const child of listing.data.children) {
+      if (child.kind !== 't1') continue;
+      const c = child.data as RedditComment;
+      out.push({
+        id: c.id,
+        author: c.author,
+        body: c.body,
+        score: c.score,
+        created_utc: c.created_utc,
+        depth: c.depth || 0,
+        parent_id: c.parent_id,
+        permalink: c.permalink,
+        is_submitter: c.is_submitter,
+        gilded: c.gilded,
+        controversiality: c.controversiality,
+      });
+
+      if (c.replies && typeof c.replies === 'object' && c.replies.kind === 'Listing') {
+        this.flattenComments(c.replies as RedditListing, out);
+      }
+    }
+  }
+
   /**
    * Fetch single post with comments
    */
@@ -936,13 +1070,10 @@ export class RedditScraper {
 
     // Extract post ID from Reddit permalink format: /r/subreddit/comments/{id}/title/
     // or handle full URL
-    let postId = 'unknown';
-    const permalinkMatch = postUrl.match(/\/comments\/([^/]+)/);
-    if (permalinkMatch) {
-      postId = permalinkMatch[1];
-    } else {
-      postId = postUrl.split('/').filter(Boolean).pop() || 'unknown';
-    }
+    const postId =
+      POST_ID_PATTERN.exec(postUrl)?.[1] ??
+      LAST_PATH_SEGMENT_PATTERN.exec(postUrl)?.[1] ??
+      'unknown';
 
     this.log(`Fetching post: ${postId}`);
 
@@ -954,6 +1085,8 @@ export class RedditScraper {
     }
 
     for (let attempt = 0; attempt < 3; attempt++) {
+      // Every attempt, retries included, spends a token from Reddit's request budget
+      await this.rateLimiter.acquire((ms) => this.delay(ms));
       await this.checkCancel();
 
       this.log(`Fetching post attempt ${attempt + 1}/3`, 'info', {
@@ -963,6 +1096,8 @@ export class RedditScraper {
       });
 
       const fetchStartTime = Date.now();
+      // Proxy this attempt runs on; other workers may rotate this.currentProxy meanwhile
+      const attemptProxyId = this.currentProxy?.id;
       try {
         // Check if using proxy via httpsAgent or currentProxy
         const isUsingProxy = !!(this.client.defaults.httpsAgent || this.currentProxy);
@@ -984,6 +1119,13 @@ export class RedditScraper {
           ...proxyInfo,
         });
 
+        // Per-request abort: the timers below cancel only this fetch, not the other workers'
+        // requests; job cancellation still reaches it through the shared controller
+        const jobSignal = this.abortController.signal;
+        const requestController = new AbortController();
+        const abortRequest = () => requestController.abort();
+        jobSignal.addEventListener('abort', abortRequest, { once: true });
+
         // Smart timeout handling: cancel and switch proxy if slow
         const timeoutWarnings: NodeJS.Timeout[] = [];
         let requestAborted = false;
@@ -1008,7 +1150,7 @@ export class RedditScraper {
             timeoutWarnings.forEach((timeout) => clearTimeout(timeout));
 
             // On attempts 0-1, switch proxy and retry
-            if (this.proxyManager && this.currentProxy?.id && attempt < 2) {
+            if (this.proxyManager && attemptProxyId && attempt < 2) {
               this.log(
                 `🔄 Smart switch: Post fetch too slow (${(elapsed / 1000).toFixed(1)}s), switching proxy immediately`,
                 'warn',
@@ -1016,23 +1158,18 @@ export class RedditScraper {
                   postId,
                   elapsed: `${(elapsed / 1000).toFixed(1)}s`,
                   attempt: attempt + 1,
-                  previousProxy: this.currentProxy.id,
+                  previousProxy: attemptProxyId,
                   reason: 'slow_response_8s',
                 },
               );
 
               // Abort current request
-              this.abortController.abort();
+              requestController.abort();
               requestAborted = true;
 
               // Mark proxy as failed and switch
-              this.proxyManager.markProxyFailed(
-                this.currentProxy.id,
-                `Slow response: ${(elapsed / 1000).toFixed(1)}s`,
-              );
-              const switched = this.switchToNextProxy(
-                `Slow response: ${(elapsed / 1000).toFixed(1)}s`,
-              );
+              const reason = `Slow response: ${(elapsed / 1000).toFixed(1)}s`;
+              const switched = this.rotateFailedProxy(attemptProxyId, reason, reason);
 
               if (switched) {
                 this.log(`✅ Smart switch completed, ready for retry with new proxy`, 'info', {
@@ -1060,12 +1197,12 @@ export class RedditScraper {
                 postId,
                 elapsed: `${(elapsed / 1000).toFixed(1)}s`,
                 attempt: attempt + 1,
-                proxyId: this.currentProxy?.id,
+                proxyId: attemptProxyId,
                 reason: 'last_attempt_timeout_15s',
               },
             );
 
-            this.abortController.abort();
+            requestController.abort();
             requestAborted = true;
           }
         }, 15000); // Give up after 15s on last attempt
@@ -1073,7 +1210,9 @@ export class RedditScraper {
 
         let response;
         try {
-          response = await this.client.get<RedditThing[]>(jsonUrl);
+          response = await this.client.get<RedditThing[]>(jsonUrl, {
+            signal: requestController.signal,
+          });
           // Clear all timeout warnings on success
           timeoutWarnings.forEach((timeout) => clearTimeout(timeout));
         } catch (error: any) {
@@ -1102,6 +1241,8 @@ export class RedditScraper {
           }
 
           throw error;
+        } finally {
+          jobSignal.removeEventListener('abort', abortRequest);
         }
 
         const fetchDuration = Date.now() - fetchStartTime;
@@ -1123,12 +1264,12 @@ export class RedditScraper {
           });
 
           // Mark proxy as failed and switch
-          if (this.proxyManager && this.currentProxy?.id && attempt < 2) {
-            this.proxyManager.markProxyFailed(
-              this.currentProxy.id,
+          if (this.proxyManager && attemptProxyId && attempt < 2) {
+            const switched = this.rotateFailedProxy(
+              attemptProxyId,
+              '403 Forbidden',
               '403 Forbidden - IP blocked by Reddit',
             );
-            const switched = this.switchToNextProxy('403 Forbidden');
             if (switched) {
               this.log(`🔄 Switching proxy after 403 (attempt ${attempt + 2}/3)`, 'info', {
                 postId,
@@ -1170,40 +1311,15 @@ export class RedditScraper {
         const post = postThing.data as RedditPost;
         const comments: FlattenedComment[] = [];
 
-        const processComments = (listing: RedditListing) => {
-          for (const child of listing.data.children) {
-            if (child.kind === 't1') {
-              const c = child.data as RedditComment;
-              comments.push({
-                id: c.id,
-                author: c.author,
-                body: c.body,
-                score: c.score,
-                created_utc: c.created_utc,
-                depth: c.depth || 0,
-                parent_id: c.parent_id,
-                permalink: c.permalink,
-                is_submitter: c.is_submitter,
-                gilded: c.gilded,
-                controversiality: c.controversiality,
-              });
-
-              if (c.replies && typeof c.replies === 'object' && c.replies.kind === 'Listing') {
-                processComments(c.replies as RedditListing);
-              }
-            }
-          }
-        };
-
         if (commentListing) {
-          processComments(commentListing);
+          this.flattenComments(commentListing, comments);
         }
 
         this.log(`✓ Fetched post ${postId} (${comments.length} comments)`);
 
         // Mark proxy as successful if using proxy
-        if (this.proxyManager && this.currentProxy?.id) {
-          this.proxyManager.markProxySuccess(this.currentProxy.id);
+        if (this.proxyManager && attemptProxyId) {
+          this.proxyManager.markProxySuccess(attemptProxyId);
         }
 
         return { post, comments };
@@ -1275,12 +1391,12 @@ export class RedditScraper {
           });
 
           // Mark current proxy as failed and try switching
-          if (this.proxyManager && this.currentProxy?.id && attempt < 2) {
-            this.proxyManager.markProxyFailed(
-              this.currentProxy.id,
+          if (this.proxyManager && attemptProxyId && attempt < 2) {
+            const switched = this.rotateFailedProxy(
+              attemptProxyId,
+              '403 Forbidden',
               '403 Forbidden - IP likely blocked',
             );
-            const switched = this.switchToNextProxy('403 Forbidden');
             if (switched) {
               this.log(`🔄 Switching proxy after 403 (attempt ${attempt + 2}/3)`, 'info', {
                 postId,
@@ -1309,17 +1425,17 @@ export class RedditScraper {
               : null,
           });
 
-          // Mark current proxy as failed
-          if (this.proxyManager && this.currentProxy?.id) {
-            this.proxyManager.markProxyFailed(
-              this.currentProxy.id,
-              '407 Proxy Authentication Required',
-            );
+          // Mark current proxy as failed (unless another worker already rotated away from it)
+          if (this.proxyManager && attemptProxyId && this.currentProxy?.id === attemptProxyId) {
+            this.proxyManager.markProxyFailed(attemptProxyId, '407 Proxy Authentication Required');
           }
 
           // Try switching proxy if available
           if (this.proxyManager && attempt < 2) {
-            const switched = this.switchToNextProxy('407 Proxy Authentication Required');
+            const switched = this.rotateFailedProxy(
+              attemptProxyId,
+              '407 Proxy Authentication Required',
+            );
             if (switched) {
               this.log(
                 `🔄 Retrying with new proxy after auth failure (attempt ${attempt + 2}/3)`,
@@ -1349,8 +1465,9 @@ export class RedditScraper {
           });
 
           // Auto-switch proxy on timeout if available
-          if (this.proxyManager && this.currentProxy?.id && attempt < 2) {
-            const switched = this.switchToNextProxy(
+          if (this.proxyManager && attemptProxyId && attempt < 2) {
+            const switched = this.rotateFailedProxy(
+              attemptProxyId,
               `Timeout after ${(fetchDuration / 1000).toFixed(1)}s`,
             );
             if (switched) {
@@ -1365,8 +1482,8 @@ export class RedditScraper {
 
         // Network errors - try switching proxy
         if (error.code === 'ENOTFOUND' || error.code === 'ECONNREFUSED') {
-          if (this.proxyManager && this.currentProxy?.id && attempt < 2) {
-            const switched = this.switchToNextProxy(`Network error: ${error.code}`);
+          if (this.proxyManager && attemptProxyId && attempt < 2) {
+            const switched = this.rotateFailedProxy(attemptProxyId, `Network error: ${error.code}`);
             if (switched) {
               this.log(
                 `🔄 Retrying with new proxy after network error (attempt ${attempt + 2}/3)`,
@@ -1468,72 +1585,79 @@ export class RedditScraper {
 
       this.log(`Step 2: Starting to fetch post details...`, 'info', {
         totalPosts: postUrls.length,
-        estimatedTime: `${((postUrls.length * 3) / 60).toFixed(1)} minutes (assuming 3s per post)`,
+        concurrency: POST_FETCH_CONCURRENCY,
+        estimatedTime: `${(postUrls.length / 60).toFixed(1)} minutes (at ~60 requests/minute)`,
       });
 
-      // Step 2: Fetch posts serially (for better cancellation)
-      const posts: Array<{ post: RedditPost; comments: FlattenedComment[] }> = [];
-      const detailsFetchStartTime = Date.now();
+      // Step 2: Fetch posts with a small worker pool; results keep listing order
+      const results: Array<{ post: RedditPost; comments: FlattenedComment[] } | undefined> =
+        new Array(postUrls.length);
+      let nextIndex = 0;
+      let completed = 0;
+      let succeeded = 0;
 
       const processingStartTime = Date.now();
-      for (let i = 0; i < postUrls.length; i++) {
-        const postStartTime = Date.now();
-        await this.checkCancel();
-
-        const { url, id } = postUrls[i];
-        this.log(`[${i + 1}/${postUrls.length}] Starting to process post`, 'info', {
-          postId: id,
-          url,
-          progress: `${i + 1}/${postUrls.length}`,
-          successCount: posts.length,
-          elapsedTime: `${((Date.now() - processingStartTime) / 1000).toFixed(1)}s`,
-        });
-
-        try {
-          const fetchStartTime = Date.now();
-          const result = await this.fetchPost(url);
-          const fetchDuration = Date.now() - fetchStartTime;
-
-          posts.push(result);
-
-          this.emitProgress(
-            posts.length,
-            postUrls.length,
-            `Scraped ${posts.length}/${postUrls.length} posts`,
-          );
-          this.log(`✓ [${i + 1}/${postUrls.length}] Post processed successfully`, 'info', {
-            postId: id,
-            comments: result.comments.length,
-            fetchDuration: `${fetchDuration}ms`,
-            totalSuccess: posts.length,
-            totalFailed: i + 1 - posts.length,
-          });
-        } catch (error: any) {
-          const errorDuration = Date.now() - postStartTime;
-          this.log(`✗ [${i + 1}/${postUrls.length}] Post processing failed`, 'warn', {
+      const worker = async () => {
+        while (nextIndex < postUrls.length) {
+          const i = nextIndex++;
+          const postStartTime = Date.now();
+          await this.checkCancel();
+
+          const { url, id } = postUrls[i];
+          this.log(`[${i + 1}/${postUrls.length}] Starting to process post`, 'info', {
             postId: id,
             url,
-            error: error.message,
-            errorType: error.name || error.code || 'Unknown',
-            duration: `${errorDuration}ms`,
-            successCount: posts.length,
-            failedCount: i + 1 - posts.length,
-            willContinue: true,
+            progress: `${i + 1}/${postUrls.length}`,
+            successCount: succeeded,
+            elapsedTime: `${((Date.now() - processingStartTime) / 1000).toFixed(1)}s`,
           });
-          // Continue with next post
-        }
 
-        if (i < postUrls.length - 1) {
-          const delayMs = 3000;
-          this.log(`Waiting ${delayMs}ms before next post...`, 'info', {
-            current: i + 1,
-            total: postUrls.length,
-            nextPostId: postUrls[i + 1]?.id,
-          });
-          await this.delay(delayMs);
-          this.log(`Delay completed, proceeding to next post`, 'info');
+          try {
+            const fetchStartTime = Date.now();
+            const result = await this.fetchPost(url);
+            const fetchDuration = Date.now() - fetchStartTime;
+
+            results[i] = result;
+            completed++;
+            succeeded++;
+
+            this.emitProgress(
+              succeeded,
+              postUrls.length,
+              `Scraped ${succeeded}/${postUrls.length} posts`,
+            );
+            this.log(`✓ [${i + 1}/${postUrls.length}] Post processed successfully`, 'info', {
+              postId: id,
+              comments: result.comments.length,
+              fetchDuration: `${fetchDuration}ms`,
+              totalSuccess: succeeded,
+              totalFailed: completed - succeeded,
+            });
+          } catch (error: any) {
+            completed++;
+            const errorDuration = Date.now() - postStartTime;
+            this.log(`✗ [${i + 1}/${postUrls.length}] Post processing failed`, 'warn', {
+              postId: id,
+              url,
+              error: error.message,
+              errorType: error.name || error.code || 'Unknown',
+              duration: `${errorDuration}ms`,
+              successCount: succeeded,
+              failedCount: completed - succeeded,
+              willContinue: true,
+            });
+            // Continue with next post
+          }
         }
-      }
+      };
+
+      await Promise.all(
+        Array.from({ length: Math.min(POST_FETCH_CONCURRENCY, postUrls.length) }, worker),
+      );
+
+      const posts = results.filter(
+        (result): result is { post: RedditPost; comments: FlattenedComment[] } => !!result,
+      );
 
       const totalProcessingTime = Date.now() - processingStartTime;
       this.log(`All posts processing completed`, 'info', {
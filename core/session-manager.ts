@@ -263,7 +263,11 @@ export class SessionManager {
    */
   async markBad(sessionId: string, reason?: string): Promise<void> {
     try {
-      const session = await this.prisma.cookieSession.findUnique({ where: { id: sessionId } });
+      // Only the counter is needed; skip loading the cookie payload
+      const session = await this.prisma.cookieSession.findUnique({
+        where: { id: sessionId },
+        select: { errorCount: true },
+      });
       if (!session) return;
 
       const newErrorCount = session.errorCount + 1;
@@ -60,9 +60,17 @@ healthRoutes.get('/health', async (c) => {
   return c.json(checks, status);
 });
 
-healthRoutes.get('/health/live', async (c) => {
+// Liveness payload never changes, so it is serialized once instead of per probe.
+// The response itself must never be cached: a stale 'ok' would hide a dead process.
+const LIVE_BODY = JSON.stringify({ status: 'ok' });
+const LIVE_HEADERS = {
+  'Content-Type': 'application/json; charset=UTF-8',
+  'Cache-Control': 'no-store',
+};
+
+healthRoutes.get('/health/live', (c) => {
   // Liveness probe - just check if server is running
-  return c.json({ status: 'ok' }, 200);
+  return c.body(LIVE_BODY, 200, LIVE_HEADERS);
 });
 
 healthRoutes.get('/health/ready', async (c) => {
@@ -14,6 +14,9 @@ import { createEnhancedLogger, safeJsonParse } from '../../utils';
 const jobRoutes = new Hono();
 const logger = createEnhancedLogger('JobRoutes');
 
+// States served by a single-state queue query; every job returned is already in that state
+const SINGLE_STATE_QUERIES = new Set(['completed', 'failed', 'active', 'waiting', 'delayed']);
+
 /**
  * GET /
  * List all jobs (with pagination and filtering)
@@ -56,12 +59,13 @@ jobRoutes.get('/', async (c) => {
       jobs = jobs.filter((job) => job.data.type === type);
     }
 
-    // Map to response format
+    // Map to response format (skip the per-job Redis round trip when the state is known)
+    const knownState = state && SINGLE_STATE_QUERIES.has(state) ? state : undefined;
     const jobList = await Promise.all(
       jobs.map(async (job) => ({
         id: job.id,
         type: job.data.type,
-        state: await job.getState(),
+        state: knownState ?? (await job.getState()),
         progress: job.progress,
         createdAt: job.timestamp,
         processedAt: job.processedOn,
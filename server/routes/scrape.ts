@@ -14,21 +14,70 @@ const scrapeRoutes = new Hono();
 let isShuttingDown = false;
 export const setScrapeShutdown = (val: boolean) => { isShuttingDown = val; };
 
+type QueuedResponse = {
+  success: true;
+  jobId: string;
+  dbJobId: string;
+  message: string;
+  statusUrl: string;
+  progressUrl: string;
+};
+
+// Identical submissions within this window reuse the already-queued job (pass force to bypass).
+// The entry is stored before the job is created, so concurrent duplicates await the same enqueue.
+const RECENT_SUBMISSION_TTL = 60000;
+const recentSubmissions = new Map<
+  string,
+  { response: Promise<QueuedResponse>; timestamp: number }
+>();
+
+// Only a job that has not finished yet is worth handing back; cancelled/failed ones are not
+const REUSABLE_JOB_STATES = new Set(['waiting', 'prioritized', 'delayed', 'active']);
+
+function pruneRecentSubmissions(now: number): void {
+  for (const [key, entry] of recentSubmissions) {
+    if (now - entry.timestamp >= RECENT_SUBMISSION_TTL) recentSubmissions.delete(key);
+  }
+}
+
+/**
+ * Resolve a recent submission to its response if its job is still pending.
+ * Otherwise (enqueue failed, job finished/cancelled/removed) the entry is dropped.
+ */
+async function getReusableSubmission(key: string): Promise<QueuedResponse | undefined> {
+  const entry = recentSubmissions.get(key);
+  if (!entry) return undefined;
+
+  try {
+    const response = await entry.response;
+    const job = await scrapeQueue.getJob(response.jobId);
+    if (job && REUSABLE_JOB_STATES.has(await job.getState())) return response;
+  } catch {
+    // The original enqueue failed; this caller queues its own job
+  }
+
+  if (recentSubmissions.get(key) === entry) recentSubmissions.delete(key);
+  return undefined;
+}
+
+// Input parsing patterns, compiled once
+const TWITTER_PROFILE_PATTERN = /^(?:https?:\/\/(?:www\.)?(?:x\.com|twitter\.com)\/)?@?([^/?#]*)/i;
+const REDDIT_POST_PATTERN = /\/comments\/|redd\.it\//;
+const REDDIT_SUBREDDIT_PATTERN = /reddit\.com\/r\/([^/?#]+)/i;
+
 function normalizeUsername(input: string | undefined): string | undefined {
   if (!input) return undefined;
-  const trimmed = input.trim();
-  const withoutDomain = trimmed.replace(/^https?:\/\/(?:www\.)?(?:x\.com|twitter\.com)\//i, '');
-  const cleaned = withoutDomain.replace(/^@/, '').split(/[/?#]/)[0];
+  const cleaned = TWITTER_PROFILE_PATTERN.exec(input.trim())?.[1];
   return cleaned || undefined;
 }
 
 function parseRedditInput(input: string): { subreddit?: string; postUrl?: string } {
   if (!input) return {};
   const trimmed = input.trim();
-  if (trimmed.includes('/comments/') || trimmed.includes('redd.it/')) {
+  if (REDDIT_POST_PATTERN.test(trimmed)) {
     return { postUrl: trimmed };
   }
-  const subredditMatch = trimmed.match(/reddit\.com\/r\/([^/?#]+)/i);
+  const subredditMatch = REDDIT_SUBREDDIT_PATTERN.exec(trimmed);
   if (subredditMatch) return { subreddit: subredditMatch[1] };
   return { subreddit: trimmed };
 }
@@ -42,7 +91,7 @@ scrapeRoutes.post('/scrape-v2', async (c) => {
     const body = await c.req.json();
     const {
       type, input, limit, likes, mode, dateRange,
-      enableRotation, enableProxy, strategy, antiDetectionLevel,
+      enableRotation, enableProxy, strategy, antiDetectionLevel, force,
     } = body;
 
     logger.info('Received scrape request', { type, input, limit });
@@ -81,36 +130,65 @@ scrapeRoutes.post('/scrape-v2', async (c) => {
       };
     }
 
-    const dbJob = await JobRepository.createJob({
-      type: isTwitter ? `twitter-${type}` : 'reddit',
-      config,
-      priority: type === 'thread' ? 10 : 5,
-    });
+    const submissionKey = JSON.stringify({ type, config });
+    const bypassDedup = force === true || c.req.query('force') === '1';
+    const now = Date.now();
+    pruneRecentSubmissions(now);
+
+    // Loop: while we waited on a stale entry, another request may have queued a fresh one
+    while (!bypassDedup && recentSubmissions.has(submissionKey)) {
+      const reused = await getReusableSubmission(submissionKey);
+      if (reused) {
+        logger.info('Identical request already queued, reusing job', {
+          type,
+          jobId: reused.jobId,
+        });
+        return c.json(reused);
+      }
+    }
+
+    const enqueue = async (): Promise<QueuedResponse> => {
+      const dbJob = await JobRepository.createJob({
+        type: isTwitter ? `twitter-${type}` : 'reddit',
+        config,
+        priority: type === 'thread' ? 10 : 5,
+      });
 
-    logger.info('Job created', { dbJobId: dbJob.id, type });
+      logger.info('Job created', { dbJobId: dbJob.id, type });
 
-    const jobData = {
-      jobId: dbJob.id,
-      type: isTwitter ? 'twitter' : 'reddit',
-      config,
-    };
+      const jobData = {
+        jobId: dbJob.id,
+        type: isTwitter ? 'twitter' : 'reddit',
+        config,
+      };
 
-    const bullJob = await scrapeQueue.add(dbJob.id, jobData, {
-      priority: type === 'thread' ? 10 : 5,
-    });
+      const bullJob = await scrapeQueue.add(dbJob.id, jobData, {
+        priority: type === 'thread' ? 10 : 5,
+      });
 
-    if (!bullJob.id) throw new Error('Failed to get BullMQ job ID');
+      if (!bullJob.id) throw new Error('Failed to get BullMQ job ID');
 
-    await JobRepository.updateBullJobId(dbJob.id, bullJob.id);
+      await JobRepository.updateBullJobId(dbJob.id, bullJob.id);
 
-    return c.json({
-      success: true,
-      jobId: bullJob.id,
-      dbJobId: dbJob.id,
-      message: 'Task queued successfully',
-      statusUrl: `/api/jobs/${bullJob.id}`,
-      progressUrl: `/api/jobs/${bullJob.id}/stream`,
-    });
+      return {
+        success: true,
+        jobId: bullJob.id,
+        dbJobId: dbJob.id,
+        message: 'Task queued successfully',
+        statusUrl: `/api/jobs/${bullJob.id}`,
+        progressUrl: `/api/jobs/${bullJob.id}/stream`,
+      };
+    };
+
+    const entry = { response: enqueue(), timestamp: now };
+    recentSubmissions.set(submissionKey, entry);
+
+    try {
+      return c.json(await entry.response);
+    } catch (error) {
+      if (recentSubmissions.get(submissionKey) === entry) recentSubmissions.delete(submissionKey);
+      throw error;
+    }
   } catch (err) {
     const error = err as Error;
     logger.error('Queue failed', error);
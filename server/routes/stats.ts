@@ -28,6 +28,7 @@ statsRoutes.get('/stats', async (c) => {
     }
 
     // Query database
+    const startOfToday = new Date(new Date().setHours(0, 0, 0, 0));
     const [
       totalJobs,
       totalTweets,
@@ -48,25 +49,20 @@ statsRoutes.get('/stats', async (c) => {
       prisma.tweet.count({
         where: {
           scrapedAt: {
-            gte: new Date(new Date().setHours(0, 0, 0, 0)),
+            gte: startOfToday,
           },
         },
       }),
 
-      prisma.tweet.findMany({
-        where: {
-          scrapedAt: {
-            gte: new Date(new Date().setHours(0, 0, 0, 0)),
-          },
-        },
-        select: { username: true },
-        distinct: ['username'],
-      }),
+      // Count in SQL: findMany+distinct pulls every row of today's tweets and dedupes client-side
+      prisma.$queryRaw<Array<{ count: bigint }>>`
+        SELECT COUNT(DISTINCT "username") AS count FROM "Tweet" WHERE "scrapedAt" >= ${startOfToday}
+      `,
 
       prisma.errorLog.count({
         where: {
           createdAt: {
-            gte: new Date(new Date().setHours(0, 0, 0, 0)),
+            gte: startOfToday,
           },
         },
       }),
@@ -107,7 +103,7 @@ statsRoutes.get('/stats', async (c) => {
       },
       today: {
         tweetsScraped: todayTweets,
-        uniqueUsers: uniqueUsersToday.length,
+        uniqueUsers: Number(uniqueUsersToday[0]?.count ?? 0),
         errors: errorsToday,
       },
       recentErrors: recentErrors.map((e) => ({
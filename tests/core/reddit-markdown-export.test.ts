@@ -0,0 +1,95 @@
+/**
+ * Reddit Markdown Export Unit Tests
+ */
+
+import { afterEach, beforeEach, describe, expect, test } from 'bun:test';
+import * as fs from 'node:fs';
+import * as os from 'node:os';
+import * as path from 'node:path';
+import * as zlib from 'node:zlib';
+import {
+  exportRedditToMarkdown,
+  formatPostAsMarkdown,
+} from '../../core/platforms/reddit/markdown-export';
+import { FlattenedComment, RedditPost } from '../../core/platforms/reddit/types';
+
+function createPost(id: string, title: string): RedditPost {
+  return {
+    id,
+    name: `t3_${id}`,
+    title,
+    selftext: `Body of ${title}\nsecond line`,
+    author: 'author',
+    subreddit: 'test',
+    subreddit_name_prefixed: 'r/test',
+    score: 42,
+    upvote_ratio: 0.9,
+    num_comments: 1,
+    created_utc: 1700000000,
+    url: `https://www.reddit.com/r/test/comments/${id}/`,
+    permalink: `/r/test/comments/${id}/`,
+    is_self: true,
+    gilded: 0,
+    over_18: false,
+  };
+}
+
+function createComments(postId: string): FlattenedComment[] {
+  return [
+    {
+      id: `${postId}c1`,
+      author: 'commenter',
+      body: 'Nested\nreply',
+      score: 3,
+      created_utc: 1700000100,
+      depth: 1,
+      parent_id: `t3_${postId}`,
+      permalink: `/r/test/comments/${postId}/c1/`,
+      is_submitter: false,
+      gilded: 0,
+      controversiality: 0,
+    },
+  ];
+}
+
+const gunzip = (filePath: string) => zlib.gunzipSync(fs.readFileSync(filePath)).toString('utf-8');
+
+describe('exportRedditToMarkdown', () => {
+  let outputDir: string;
+
+  beforeEach(() => {
+    outputDir = path.join(os.tmpdir(), `test-reddit-export-${Date.now()}`);
+  });
+
+  afterEach(() => {
+    fs.rmSync(outputDir, { recursive: true, force: true });
+  });
+
+  test('should gzip a single post when the filename ends in .md.gz', () => {
+    const item = { post: createPost('a1', 'Only post'), comments: createComments('a1') };
+
+    const markdownPath = exportRedditToMarkdown([item], outputDir, 'thread.md.gz');
+
+    expect(markdownPath).toBe(path.join(outputDir, 'thread.md.gz'));
+    expect(gunzip(markdownPath)).toBe(formatPostAsMarkdown(item.post, item.comments));
+  });
+
+  test('should gzip the index and every per-post file for multiple posts', () => {
+    const items = [
+      { post: createPost('b1', 'First post'), comments: createComments('b1') },
+      { post: createPost('b2', 'Second post'), comments: [] },
+    ];
+
+    const markdownPath = exportRedditToMarkdown(items, outputDir, 'index.md.gz');
+
+    expect(markdownPath).toBe(path.join(outputDir, 'index.md.gz'));
+    expect(gunzip(markdownPath)).toStartWith('# Reddit Posts Export');
+    expect(gunzip(path.join(outputDir, '001-First_post.md.gz'))).toBe(
+      formatPostAsMarkdown(items[0].post, items[0].comments),
+    );
+    expect(gunzip(path.join(outputDir, '002-Second_post.md.gz'))).toBe(
+      formatPostAsMarkdown(items[1].post, items[1].comments),
+    );
+    expect(fs.readdirSync(outputDir).every((name) => name.endsWith('.md.gz'))).toBe(true);
+  });
+});
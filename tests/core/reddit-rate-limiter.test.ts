@@ -0,0 +1,75 @@
+/**
+ * RedditRateLimiter Unit Tests
+ */
+
+import { describe, expect, test } from 'bun:test';
+import { RedditRateLimiter } from '../../core/platforms/reddit/rate-limiter';
+
+function createLimiter(burst = 3, requestsPerMinute = 60) {
+  const clock = { now: 0 };
+  const limiter = new RedditRateLimiter(burst, requestsPerMinute, () => clock.now);
+  return { clock, limiter };
+}
+
+describe('RedditRateLimiter', () => {
+  test('should allow an initial burst then ask callers to wait', () => {
+    const { limiter } = createLimiter(3, 60);
+
+    expect(limiter.tryAcquire()).toBe(0);
+    expect(limiter.tryAcquire()).toBe(0);
+    expect(limiter.tryAcquire()).toBe(0);
+    expect(limiter.tryAcquire()).toBe(1000);
+  });
+
+  test('should refill tokens over time without exceeding the burst size', () => {
+    const { clock, limiter } = createLimiter(2, 60);
+    limiter.tryAcquire();
+    limiter.tryAcquire();
+
+    clock.now = 60000;
+    expect(limiter.tryAcquire()).toBe(0);
+    expect(limiter.tryAcquire()).toBe(0);
+    expect(limiter.tryAcquire()).toBeGreaterThan(0);
+  });
+
+  test('should follow the remaining budget reported by Reddit', () => {
+    const { limiter } = createLimiter(3, 60);
+    limiter.observeHeaders({ 'x-ratelimit-remaining': '10', 'x-ratelimit-reset': '100' });
+
+    // 10 requests left over 100s -> one token every 10s
+    expect(limiter.tryAcquire()).toBe(0);
+    expect(limiter.tryAcquire()).toBe(0);
+    expect(limiter.tryAcquire()).toBe(0);
+    expect(limiter.tryAcquire()).toBe(10000);
+  });
+
+  test('should hold requests until the window resets when the budget is spent', () => {
+    const { limiter } = createLimiter(3, 60);
+    limiter.observeHeaders({ 'x-ratelimit-remaining': '0.0', 'x-ratelimit-reset': '42' });
+
+    expect(limiter.tryAcquire()).toBe(42000);
+  });
+
+  test('should ignore responses without rate limit headers', () => {
+    const { limiter } = createLimiter(1, 60);
+    limiter.observeHeaders({});
+    limiter.observeHeaders({ 'x-ratelimit-remaining': 'abc', 'x-ratelimit-reset': '10' });
+
+    expect(limiter.tryAcquire()).toBe(0);
+    expect(limiter.tryAcquire()).toBe(1000);
+  });
+
+  test('acquire should wait through the provided delay function', async () => {
+    const { clock, limiter } = createLimiter(1, 60);
+    const waits: number[] = [];
+    const wait = async (ms: number) => {
+      waits.push(ms);
+      clock.now += ms;
+    };
+
+    await limiter.acquire(wait);
+    await limiter.acquire(wait);
+
+    expect(waits).toEqual([1000]);
+  });
+});
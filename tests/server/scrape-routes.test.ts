@@ -0,0 +1,111 @@
+/**
+ * Scrape Routes Tests
+ * Mocks the queue and repositories to test submission dedup without Redis/Postgres
+ */
+
+import { beforeAll, beforeEach, describe, expect, mock, test } from 'bun:test';
+import type { Hono } from 'hono';
+
+let nextDbId = 0;
+const jobStates = new Map<string, string>();
+
+const createJob = mock(async () => ({ id: `db-${++nextDbId}` }));
+const updateBullJobId = mock(async () => {});
+const add = mock(async (name: string) => {
+  // Yield so concurrent submissions really overlap while the job is being queued
+  await new Promise((resolve) => setTimeout(resolve, 5));
+  const id = `bull-${name}`;
+  jobStates.set(id, 'waiting');
+  return { id };
+});
+const getJob = mock(async (id: string) =>
+  jobStates.has(id) ? { getState: async () => jobStates.get(id) } : undefined,
+);
+
+mock.module('../../core/queue/scrape-queue', () => ({
+  scrapeQueue: { add, getJob },
+}));
+
+mock.module('../../core/db/repositories', () => ({
+  JobRepository: { createJob, updateBullJobId },
+}));
+
+describe('POST /scrape-v2', () => {
+  let scrapeRoutes: Hono;
+
+  const submit = async (body: Record<string, unknown>, query = '') => {
+    const res = await scrapeRoutes.request(`/scrape-v2${query}`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify(body),
+    });
+    return { status: res.status, data: (await res.json()) as any };
+  };
+
+  beforeAll(async () => {
+    scrapeRoutes = (await import('../../server/routes/scrape')).default;
+  });
+
+  beforeEach(() => {
+    createJob.mockClear();
+  });
+
+  test('should queue a single job for back-to-back identical submissions', async () => {
+    const body = { type: 'reddit', input: 'concurrent' };
+
+    const [first, second] = await Promise.all([submit(body), submit(body)]);
+
+    expect(first.status).toBe(200);
+    expect(second.status).toBe(200);
+    expect(second.data.jobId).toBe(first.data.jobId);
+    expect(createJob).toHaveBeenCalledTimes(1);
+  });
+
+  test('should reuse a job that is still pending', async () => {
+    const body = { type: 'reddit', input: 'repeat' };
+
+    const first = await submit(body);
+    jobStates.set(first.data.jobId, 'active');
+    const second = await submit(body);
+
+    expect(second.data.jobId).toBe(first.data.jobId);
+    expect(createJob).toHaveBeenCalledTimes(1);
+  });
+
+  test('should queue a new job when force is set', async () => {
+    const body = { type: 'reddit', input: 'forced' };
+
+    const first = await submit(body);
+    const viaBody = await submit({ ...body, force: true });
+    const viaQuery = await submit(body, '?force=1');
+
+    expect(viaBody.data.jobId).not.toBe(first.data.jobId);
+    expect(viaQuery.data.jobId).not.toBe(viaBody.data.jobId);
+    expect(createJob).toHaveBeenCalledTimes(3);
+  });
+
+  test('should queue a new job when the earlier one was cancelled', async () => {
+    const body = { type: 'reddit', input: 'cancelled' };
+
+    const first = await submit(body);
+    jobStates.set(first.data.jobId, 'failed');
+    const second = await submit(body);
+
+    expect(second.data.jobId).not.toBe(first.data.jobId);
+    expect(createJob).toHaveBeenCalledTimes(2);
+  });
+
+  test('should not remember a submission whose enqueue failed', async () => {
+    const body = { type: 'reddit', input: 'flaky' };
+    createJob.mockImplementationOnce(async () => {
+      throw new Error('db down');
+    });
+
+    const failed = await submit(body);
+    const retried = await submit(body);
+
+    expect(failed.status).toBe(500);
+    expect(retried.status).toBe(200);
+    expect(retried.data.success).toBe(true);
+  });
+});
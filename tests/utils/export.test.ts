@@ -9,6 +9,7 @@ import * as os from 'node:os';
 import * as path from 'node:path';
 import { Tweet } from '../../types/tweet-definitions';
 import * as exportUtils from '../../utils/export';
+import { mergeMarkdownFiles } from '../../utils/export-manager';
 import * as fileUtils from '../../utils/fileutils';
 
 describe('Export Utils', () => {
@@ -135,4 +136,55 @@ describe('Export Utils', () => {
       await expect(exportUtils.exportToJson(mockTweets, {} as any)).rejects.toThrow();
     });
   });
+
+  describe('mergeMarkdownFiles', () => {
+    const separator = '\n\n---\n\n';
+
+    const writeSources = async (dir: string, count: number) => {
+      await fs.promises.mkdir(dir, { recursive: true });
+      const names = Array.from(
+        { length: count },
+        (_, i) => `post-${String(i).padStart(2, '0')}.md`,
+      );
+      for (const name of names) {
+        await fs.promises.writeFile(path.join(dir, name), `content of ${name}`);
+      }
+      return names;
+    };
+
+    test('should merge more than one read batch in order with separators', async () => {
+      const sourceDir = path.join(testOutputDir, 'merge-source');
+      const outputDir = path.join(testOutputDir, 'merge-output');
+      const names = await writeSources(sourceDir, 40);
+
+      const mergedPath = await mergeMarkdownFiles(sourceDir, outputDir, 'x');
+
+      expect(mergedPath).toBeTruthy();
+      const content = await fs.promises.readFile(mergedPath!, 'utf-8');
+      // Newest-first by filename, numbered, separated across batch boundaries too
+      const expectedBody = [...names]
+        .reverse()
+        .map((name, i) => `${i > 0 ? separator : ''}## ${i + 1}.\n\ncontent of ${name}`)
+        .join('');
+      expect(content).toContain('totalItemsMerged: 40');
+      expect(content.endsWith(expectedBody)).toBe(true);
+      expect(await fs.promises.readdir(outputDir)).toEqual([path.basename(mergedPath!)]);
+    });
+
+    test('should leave no merged file behind when a source cannot be read', async () => {
+      const sourceDir = path.join(testOutputDir, 'merge-broken-source');
+      const outputDir = path.join(testOutputDir, 'merge-broken-output');
+      await writeSources(sourceDir, 20);
+      // Broken symlink that sorts into the second read batch, after output has been written
+      await fs.promises.symlink(
+        path.join(sourceDir, 'missing.txt'),
+        path.join(sourceDir, 'post-00a.md'),
+      );
+
+      const mergedPath = await mergeMarkdownFiles(sourceDir, outputDir, 'x');
+
+      expect(mergedPath).toBeNull();
+      expect(await fs.promises.readdir(outputDir)).toEqual([]);
+    });
+  });
 });
@@ -211,6 +211,19 @@ describe('FileSystem Utils', () => {
         expect(files[0]).toContain('normal.md');
       });
 
+      test('should include symlinked markdown files', async () => {
+        const dir = path.join(testOutputDir, 'markdown-test3');
+        await fsPromises.mkdir(dir, { recursive: true });
+
+        await fsPromises.writeFile(path.join(dir, 'source.txt'), 'content');
+        await fsPromises.symlink(path.join(dir, 'source.txt'), path.join(dir, 'linked.md'));
+
+        const files = await fileUtils.getMarkdownFiles(dir);
+
+        expect(files.length).toBe(1);
+        expect(files[0]).toContain('linked.md');
+      });
+
       test('should return empty array for non-existent directory', async () => {
         const files = await fileUtils.getMarkdownFiles('/non/existent/path');
         expect(files).toEqual([]);
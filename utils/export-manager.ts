@@ -8,6 +8,24 @@ import { ensureBaseStructure, getDefaultOutputRoot, getMarkdownFiles, RunContext
 
 const DEFAULT_CONVERGENCE_DIR = path.join(getDefaultOutputRoot(), 'convergence');
 const COOKIE_FILE = path.join(__dirname, '..', 'env.json');
+const MERGE_READ_CONCURRENCY = 16;
+
+// Built once and reused per item; same output as toLocaleDateString()/toLocaleTimeString()
+const LOCALE_DATE_FORMAT = new Intl.DateTimeFormat(undefined, {
+  year: 'numeric',
+  month: 'numeric',
+  day: 'numeric',
+});
+const LOCALE_TIME_FORMAT = new Intl.DateTimeFormat(undefined, {
+  hour: 'numeric',
+  minute: 'numeric',
+  second: 'numeric',
+});
+
+function formatLocalDate(date: Date, format: Intl.DateTimeFormat): string {
+  // Intl throws on invalid dates where toLocale*String() returned 'Invalid Date'
+  return Number.isNaN(date.getTime()) ? 'Invalid Date' : format.format(date);
+}
 
 type Platform = 'x' | 'medium';
 
@@ -104,22 +122,47 @@ export async function mergeMarkdownFiles(
     ].join('\n');
 
     const separator = '\n\n---\n\n';
-    let itemIndex = 1;
-    let allItemsContent = '';
-
-    for (const file of mdFiles) {
-      const content = await fs.readFile(file, 'utf-8');
-      allItemsContent += `## ${itemIndex}.\n\n${content}${separator}`;
-      itemIndex++;
-    }
+    const mergedFilePath = path.join(outputDir, mergedFilename);
 
-    if (allItemsContent.endsWith(separator)) {
-      allItemsContent = allItemsContent.slice(0, -separator.length);
+    // Stream batches straight to disk so at most two batches of sources are held in memory.
+    // Files are read in parallel within a batch, and the next batch is read while the
+    // current one is written; batch order keeps the output sorted.
+    const readBatch = (start: number) =>
+      Promise.all(
+        mdFiles
+          .slice(start, start + MERGE_READ_CONCURRENCY)
+          .map((file) => fs.readFile(file, 'utf-8')),
+      );
+    // Written under a temporary name and renamed once complete, so a failed read or write
+    // leaves no truncated merged-*.md behind
+    const partialFilePath = `${mergedFilePath}.partial`;
+    const handle = await fs.open(partialFilePath, 'w');
+    try {
+      try {
+        await handle.write(metadataBlock);
+        let itemIndex = 0;
+        let nextBatch: Promise<string[]> | null = readBatch(0);
+        for (let i = 0; nextBatch; i += MERGE_READ_CONCURRENCY) {
+          const contents: string[] = await nextBatch;
+          const nextStart = i + MERGE_READ_CONCURRENCY;
+          nextBatch = nextStart < mdFiles.length ? readBatch(nextStart) : null;
+          // Keep a failed prefetch from surfacing as an unhandled rejection if the write throws
+          nextBatch?.catch(() => {});
+          const chunk: string[] = [];
+          for (const content of contents) {
+            itemIndex++;
+            chunk.push(`${itemIndex > 1 ? separator : ''}## ${itemIndex}.\n\n${content}`);
+          }
+          await handle.write(chunk.join(''));
+        }
+      } finally {
+        await handle.close();
+      }
+      await fs.rename(partialFilePath, mergedFilePath);
+    } catch (error) {
+      await fs.unlink(partialFilePath).catch(() => {});
+      throw error;
     }
-
-    const finalContent = metadataBlock + allItemsContent;
-    const mergedFilePath = path.join(outputDir, mergedFilename);
-    await fs.writeFile(mergedFilePath, finalContent, 'utf-8');
     console.log(
       `[${platform.toUpperCase()}] ✅ All Markdown files merged and saved as: ${mergedFilename}`,
     );
@@ -158,8 +201,10 @@ export async function mergeMarkdownFiles(
 function formatTweetForConvergence(tweet: TweetLike, index: number): string {
   const date = tweet.time ? new Date(tweet.time) : new Date();
   const text = tweet.text || '';
+  const dateLabel = formatLocalDate(date, LOCALE_DATE_FORMAT);
+  const timeLabel = formatLocalDate(date, LOCALE_TIME_FORMAT);
   const content = [
-    `## ${index}. (X) ${date.toLocaleDateString()} ${date.toLocaleTimeString()}`,
+    `## ${index}. (X) ${dateLabel} ${timeLabel}`,
     '',
     `> ${text.replace(/\n/g, '\n> ')}`,
     '',
@@ -178,7 +223,7 @@ function formatMediumForConvergence(article: ArticleLike, index: number): string
     `## ${index}. (Medium) ${title}`,
     '',
     article.authorName ? `*By ${article.authorName}*` : '',
-    publishedDate ? `*Published on ${publishedDate.toLocaleDateString()}*` : '',
+    publishedDate ? `*Published on ${formatLocalDate(publishedDate, LOCALE_DATE_FORMAT)}*` : '',
     '',
     '---',
     '',
@@ -241,10 +286,10 @@ export async function mergeAllPlatforms(
   ].join('\n');
 
   const separator = '\n\n---\n\n';
-  let finalContent = metadataBlock;
-  let itemIndex = 1;
+  const formattedItems: string[] = [];
 
   for (const item of allItems) {
+    const itemIndex = formattedItems.length + 1;
     let formattedItem = '';
     if (item.platform === 'x') {
       formattedItem = formatTweetForConvergence(item, itemIndex);
@@ -253,14 +298,11 @@ export async function mergeAllPlatforms(
     }
 
     if (formattedItem) {
-      finalContent += formattedItem + separator;
-      itemIndex++;
+      formattedItems.push(formattedItem);
     }
   }
 
-  if (finalContent.endsWith(separator)) {
-    finalContent = finalContent.slice(0, -separator.length);
-  }
+  const finalContent = metadataBlock + formattedItems.join(separator);
 
   const mergedFilePath = path.join(outputDir, mergedFilename);
   try {
@@ -281,6 +323,19 @@ export async function exportToJson<T>(data: T[], filePathOrContext: string | Run
   await fs.writeFile(filePath, JSON.stringify(data, null, 2), 'utf-8');
 }
 
+const CSV_NEEDS_QUOTING = /[",\n]/;
+const CSV_QUOTE = /"/g;
+
+function toCsvCell(value: unknown): string {
+  if (value === null || value === undefined) return '';
+  if (typeof value === 'object') return `"${JSON.stringify(value).replace(CSV_QUOTE, '""')}"`;
+  const stringValue = String(value);
+  if (CSV_NEEDS_QUOTING.test(stringValue)) {
+    return `"${stringValue.replace(CSV_QUOTE, '""')}"`;
+  }
+  return stringValue;
+}
+
 export async function exportToCsv<T extends Record<string, any>>(data: T[], filePathOrContext: string | RunContext): Promise<void> {
   if (!data || data.length === 0) return;
   const filePath = typeof filePathOrContext === 'string' ? filePathOrContext : filePathOrContext.csvPath;
@@ -289,21 +344,15 @@ export async function exportToCsv<T extends Record<string, any>>(data: T[], file
   await fs.mkdir(dir, { recursive: true });
 
   const headers = Object.keys(data[0]);
-  const csvContent = [
-    headers.join(','),
-    ...data.map(row => 
-      headers.map(header => {
-        const value = row[header];
-        if (value === null || value === undefined) return '';
-        if (typeof value === 'object') return `"${JSON.stringify(value).replace(/"/g, '""')}"`;
-        const stringValue = String(value);
-        if (stringValue.includes(',') || stringValue.includes('"') || stringValue.includes('\n')) {
-          return `"${stringValue.replace(/"/g, '""')}"`;
-        }
-        return stringValue;
-      }).join(',')
-    )
-  ].join('\n');
+  const lines: string[] = [headers.join(',')];
+  for (const row of data) {
+    const cells: string[] = [];
+    for (const header of headers) {
+      cells.push(toCsvCell(row[header]));
+    }
+    lines.push(cells.join(','));
+  }
+  const csvContent = lines.join('\n');
 
   await fs.writeFile(filePath, csvContent, 'utf-8');
 }
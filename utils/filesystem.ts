@@ -48,10 +48,18 @@ export function getTodayString(): string {
 export async function getMarkdownFiles(dir: string): Promise<string[]> {
   if (!dir) return [];
   try {
-    const files = await fsPromises.readdir(dir);
-    return files
-      .filter((file) => file.endsWith('.md') && !file.startsWith('merged-') && !file.startsWith('digest-'))
-      .map((file) => path.join(dir, file));
+    // Dirent carries the entry type, so directories are skipped without a stat() per entry;
+    // symlinks are kept (as before) since they usually point at markdown files elsewhere
+    const entries = await fsPromises.readdir(dir, { withFileTypes: true });
+    return entries
+      .filter(
+        (entry) =>
+          (entry.isFile() || entry.isSymbolicLink()) &&
+          entry.name.endsWith('.md') &&
+          !entry.name.startsWith('merged-') &&
+          !entry.name.startsWith('digest-'),
+      )
+      .map((entry) => path.join(dir, entry.name));
   } catch (_error: any) {
     return [];
   }